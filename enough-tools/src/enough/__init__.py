@@ -1,6 +1,7 @@
 from enough.attrmap import AttrMap
 from enough.enumerrors import EnumErrors
 from enough.fn import (
+    Bounds,
     bounds,
     concat,
     dag_stages,
@@ -59,6 +60,7 @@ __all__ = [
     'VP', 'VP1', 'VP2',
     'VM', 'VM1', 'VM2',
     'AttrMap',
+    'Bounds',
     'Catchable',
     'EnumErrors',
     'FnLoggingHandler',
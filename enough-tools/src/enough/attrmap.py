@@ -5,15 +5,36 @@ class AttrMap(Mapping[str, object]):
     """Mapping which acts as a wrapper around an object, using ``getattr`` for
     that object in order to implement ``__getitem__``.
     """
+    __slots__ = 'wrapped', '_cached_dir'
+
     #: The wrapped object.
     wrapped: object
 
+    # Cached result of dir(self.wrapped), computed on first use.
+    _cached_dir: tuple[str, ...] | None
+
     def __init__(self, obj: object) -> None:
         """Initialize this map with an object to wrap.
 
         :param obj: Object to wrap.
         """
         self.wrapped = obj
+        self._cached_dir = None
+
+    def _dir(self) -> tuple[str, ...]:
+        # Get dir(self.wrapped), computing it only the first time it is needed.
+        if self._cached_dir is None:
+            self._cached_dir = tuple(dir(self.wrapped))
+        return self._cached_dir
+
+    def __contains__(self, attr: object) -> bool:
+        """Determines whether ``self.wrapped`` has the given attribute.
+
+        :param attr: Name of the attribute to check for.
+        :return: ``True`` if ``self.wrapped`` has ``attr``, ``False``
+            otherwise.
+        """
+        return isinstance(attr, str) and hasattr(self.wrapped, attr)
 
     def __getitem__(self, attr: str) -> object:
         """Gets the value of the requested attribute in ``self.wrapped``.
@@ -30,16 +51,19 @@ class AttrMap(Mapping[str, object]):
 
     def __iter__(self) -> Iterator[str]:
         """Returns an iterator over the attributes of ``self.wrapped``. Uses
-        ``dir``, results will not be accurate when ``dir`` is inaccurate.
+        ``dir``, results will not be accurate when ``dir`` is inaccurate. The
+        result of ``dir`` is computed once and cached, so attributes added to
+        or removed from ``self.wrapped`` afterwards will not be reflected.
 
         :return: An iterator over the attributes of ``self.wrapped``.
         """
-        return iter(dir(self.wrapped))
+        return iter(self._dir())
 
     def __len__(self) -> int:
         """Gets the number of attributes of ``self.wrapped``. Uses ``dir``,
-        results will not be accurate when ``dir`` is inaccurate.
+        results will not be accurate when ``dir`` is inaccurate. Like
+        ``__iter__``, uses the cached result of ``dir``.
 
         :return: The number of attributes of ``self.wrapped``.
         """
-        return len(dir(self.wrapped))
+        return len(self._dir())
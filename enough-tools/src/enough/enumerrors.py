@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-import dataclasses
+import ast
+import builtins
+import functools
+import sys
 import typing
-from collections import OrderedDict
 from collections.abc import Callable, Iterable
 from contextlib import contextmanager
 from enum import Enum, EnumMeta
@@ -13,6 +15,153 @@ from enough._exception import EnoughError
 from enough.attrmap import AttrMap
 from enough.types import Catchable, E, E2, T
 
+# Name to use for self in generated methods, since "self" may be an attribute
+# name.
+_SELF: Final[str] = '__enum_errors_self__'
+
+# Canonical instance of each set of attributes recognized by an enumerated
+# exception type, so that types recognizing the same attributes share one.
+_ATTRS: Final[dict[frozenset[str], frozenset[str]]] = {}
+
+# Cache of methods created by _dataclass_methods for each tuple of attributes.
+_DATACLASS_METHODS: Final[
+    dict[tuple[str, ...], dict[str, Callable[..., object]]]
+] = {}
+
+
+def _dataclass_methods(
+    attrs: tuple[str, ...]
+) -> dict[str, Callable[..., object]]:
+    # Create __init__, __repr__, and __eq__ methods which behave the same as
+    # those dataclasses.dataclass would create for a class with the given
+    # attributes. Many enumerated exceptions share the same attributes, so the
+    # methods are only created once for each tuple of attributes and shared
+    # between exception types. This is much cheaper than using
+    # dataclasses.dataclass, which inspects the class and compiles new methods
+    # every time. "self" may be an attribute name, so use another name for it.
+    if (methods := _DATACLASS_METHODS.get(attrs)) is not None:
+        return methods
+    self = _SELF
+    params = ''.join(f', {attr}' for attr in attrs)
+    assignments = ''.join(f'    {self}.{attr} = {attr}\n' for attr in attrs)
+    fields = ', '.join(f'{attr}={{{self}.{attr}!r}}' for attr in attrs)
+    values = ''.join(f'{self}.{attr}, ' for attr in attrs)
+    other_values = ''.join(f'other.{attr}, ' for attr in attrs)
+    source = (
+        f'def __init__({self}{params}):\n'
+        f'{assignments}'
+        f'    pass\n'
+        f'def __repr__({self}):\n'
+        f'    return f"{{{self}.__class__.__qualname__}}({fields})"\n'
+        f'def __eq__({self}, other):\n'
+        f'    if other.__class__ is {self}.__class__:\n'
+        f'        return ({values}) == ({other_values})\n'
+        f'    return NotImplemented\n'
+    )
+    methods = {}
+    exec(source, {}, methods)
+    return _DATACLASS_METHODS.setdefault(attrs, methods)
+
+
+def _forwarded_kwargs(
+    typ: EnumErrors[E2],
+    e: E2,
+    forward: bool | Iterable[str],
+    kwargs: dict[str, object]
+) -> dict[str, object]:
+    # Get the keyword arguments with which to make the exception raised in place
+    # of e (see EnumErrors.wrap), updating kwargs with the forwarded attributes.
+    forwards = (
+        typ.attrs if forward is True
+        else () if not forward
+        else forward
+    )
+    for attr in forwards:
+        kwargs[attr] = getattr(e, attr)
+    return kwargs
+
+
+def _noop_init(*args: object, **kwargs: object) -> None:
+    # __init__ for enumerated exception types while the enum is being created
+    # (see _EnumErrors.__new__).
+    pass
+
+
+class _SelfAttributes(ast.NodeTransformer):
+    # Rewrites names in an expression which refer to attributes of an exception
+    # so that they are accessed on the variable _SELF instead. Only names
+    # evaluated in the scope of the expression itself are visited: names inside
+    # lambdas and comprehensions (other than their default values and first
+    # iterables) are not, just as they are not looked up in the locals mapping
+    # when the expression is evaluated with eval.
+
+    # Determines whether a name refers to an attribute of the exception.
+    is_attr: Callable[[str], bool]
+
+    # Whether a name which could not be resolved statically was found.
+    unresolved: bool
+
+    def __init__(self, is_attr: Callable[[str], bool]) -> None:
+        self.is_attr = is_attr
+        self.unresolved = False
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        if not isinstance(node.ctx, ast.Load):
+            # Assignment expressions would assign to the locals mapping.
+            self.unresolved = True
+        elif self.is_attr(node.id):
+            return ast.copy_location(
+                ast.Attribute(ast.Name(_SELF, ast.Load()), node.id, ast.Load()),
+                node
+            )
+        elif not hasattr(builtins, node.id):
+            self.unresolved = True
+        return node
+
+    def visit_Lambda(self, node: ast.Lambda) -> ast.AST:
+        node.args.defaults = [self.visit(d) for d in node.args.defaults]
+        node.args.kw_defaults = [
+            d if d is None else self.visit(d) for d in node.args.kw_defaults
+        ]
+        return node
+
+    def _visit_comprehension(self, node: ast.AST) -> ast.AST:
+        node.generators[0].iter = self.visit(node.generators[0].iter)
+        return node
+
+    visit_DictComp = _visit_comprehension
+    visit_GeneratorExp = _visit_comprehension
+    visit_ListComp = _visit_comprehension
+    visit_SetComp = _visit_comprehension
+
+
+def _str_method(fmt: str, typ: type) -> Callable[[object], str] | None:
+    # Create a __str__ method for typ which evaluates fmt as an f-string in
+    # which names refer to attributes of the exception, so that it does not
+    # have to be evaluated with eval and an AttrMap each time. This is only
+    # possible when every name can be resolved when typ is created: it must
+    # either be an attribute visible to instances of typ (one in typ.attrs or
+    # defined in a class in its MRO) or a builtin. Names are looked up in class
+    # dictionaries rather than with hasattr so that no descriptors are invoked,
+    # and so that attributes of the enumeration class itself, which instances
+    # cannot see, are not mistaken for instance attributes.
+    # Returns None if this is not the case.
+    expr = ast.parse(f'f{fmt!r}', mode='eval').body
+    mro = typ.__mro__
+    transformer = _SelfAttributes(
+        lambda name: name in typ.attrs or any(name in vars(c) for c in mro)
+    )
+    expr = transformer.visit(expr)
+    if transformer.unresolved:
+        return None
+    methods = {}
+    exec(
+        f'def __str__({_SELF}):\n    return {ast.unparse(expr)}\n',
+        {},
+        methods
+    )
+    return methods['__str__']
+
 
 class _EnumErrors(type, Generic[E]):
     # This class basically contains the implementation of EnumErrors. Having
@@ -24,6 +173,9 @@ class _EnumErrors(type, Generic[E]):
     # The compiled f-string.
     _compiled: CodeType
 
+    # Cached result of error_type.
+    _error_type: type[E]
+
     #: Recognized attributes.
     attrs: frozenset[str]
 
@@ -33,17 +185,24 @@ class _EnumErrors(type, Generic[E]):
 
         :return: Exception type this was parameterized with.
         """
+        # This is called for every enumerated exception type, so cache the
+        # result. Check mcs.__dict__ rather than using getattr so that a result
+        # cached for a base class is not used.
+        if '_error_type' in mcs.__dict__:
+            return mcs._error_type
         # Get the type arg this is parameterized with.
         # Avoid a circular import by handling these types specially.
         if (
             mcs.__name__ == 'EnumErrorsErrors'
             or mcs.__name__ == 'EnoughTypingErrors'
         ):
-            return EnoughError
-        import enough.typing
-        return typing.get_args(
-            enough.typing.infer_type_args(mcs, EnumErrors)
-        )[0]
+            mcs._error_type = EnoughError
+        else:
+            import enough.typing
+            mcs._error_type = typing.get_args(
+                enough.typing.infer_type_args(mcs, EnumErrors)
+            )[0]
+        return mcs._error_type
 
     def mro(cls=None) -> list[type]:
         # This needs to be defined since EnumMeta does not expect mixins to
@@ -87,29 +246,38 @@ class _EnumErrors(type, Generic[E]):
             raise EnumErrorsErrors.NotType(type_arg)
         if not issubclass(type_arg, BaseException):
             raise EnumErrorsErrors.NotExcType(type_arg)
+        # Intern attribute names, since they will be used to get and set
+        # attributes.
         if isinstance(attrs, str):
-            attrs = frozenset({attrs})
+            attrs = frozenset((sys.intern(attrs),))
         else:
-            attrs = frozenset(attrs)
-        if not isinstance(mixins, Iterable):
-            mixins = mixins,
-        typ = type.__new__(mcs, '', (type_arg,) + tuple(mixins), {})
+            attrs = frozenset(sys.intern(attr) for attr in attrs)
+        attrs = _ATTRS.setdefault(attrs, attrs)
+        # Checking for a single type is cheaper than checking for an Iterable,
+        # which goes through ABCMeta.__instancecheck__.
+        mixins = (mixins,) if isinstance(mixins, type) else tuple(mixins)
+        typ = type.__new__(mcs, '', (type_arg,) + mixins, {})
         # Respect the order given in attrs.
-        typ.__annotations__ = OrderedDict((attr, Any) for attr in attrs)
+        typ.__annotations__ = dict.fromkeys(attrs, Any)
         if 'args' in attrs:
             # This allows attributes Exception.args to be repurposed. Otherwise,
-            # dataclass might complain that a non-default attribute follows a
-            # default one, if there is another attribute after args.
-            typ.args = dataclasses.MISSING
-        typ = dataclasses.dataclass(typ)
-        typ.attrs = frozenset(attrs)
+            # BaseException.args would convert the value to a tuple when set.
+            typ.args = None
+        for name, method in _dataclass_methods(tuple(attrs)).items():
+            setattr(typ, name, method)
+        # Like a dataclass with eq=True, instances are unhashable.
+        typ.__hash__ = None
+        typ.attrs = attrs
 
         typ._compiled = compile(f'f{fmt!r}', '<string>', 'eval')
-        typ._original_init = typ.__init__
-        typ.__init__ = lambda *args, **kwargs: None
+        # EnumMeta calls __init__ on each member with the value given for it,
+        # which would fail with the dataclass-like __init__. So, use an
+        # __init__ which does nothing until _EnumErrorsMeta restores it.
+        typ.__init__ = _noop_init
 
         def __str__(self) -> str:
-            # Create new string method for instance.
+            # Create new string method for instance. _EnumErrorsMeta replaces
+            # this with a compiled method when possible (see _str_method).
             return eval(self._compiled, {}, AttrMap(self))
 
         typ.__str__ = __str__
@@ -187,14 +355,43 @@ class _EnumErrors(type, Generic[E]):
         try:
             yield
         except typ as e:
-            forwards = (
-                typ.attrs if forward is True
-                else () if not forward
-                else forward
-            )
-            for attr in forwards:
-                kwargs[attr] = getattr(e, attr)
-            raise cls(**kwargs)
+            raise cls(**_forwarded_kwargs(typ, e, forward, kwargs))
+
+    def wrap_fn(
+        cls,
+        typ: EnumErrors[E2],
+        forward: bool | Iterable[str] = True,
+        **kwargs: object
+    ) -> Callable[[Callable[..., T]], Callable[..., T]]:
+        """Decorator which, upon an exception inheriting from ``typ`` being
+        raised by the decorated function, instead raises an exception of this
+        type in the same way as :meth:`wrap`. Cheaper than using :meth:`wrap`
+        around the body of a function, since no context manager needs to be
+        created and entered on each call.
+
+        :param typ: Exception type to wrap. Must be an instance of
+            :class:`.EnumErrors`.
+        :param forward: If ``True``, forward all attributes from the caught
+            exception to the raised exception. If ``False``, do not do any
+            forwarding. If instead a collection is specified, all attributes
+            from that collection will be forward and no others.
+        :param kwargs: Additional keyword args used to make the exception.
+        :return: The decorator.
+        """
+        def decorator(fn: Callable[..., T]) -> Callable[..., T]:
+            @functools.wraps(fn)
+            def wrapper(*args: object, **fn_kwargs: object) -> T:
+                try:
+                    return fn(*args, **fn_kwargs)
+                except typ as e:
+                    # Copy kwargs since it is shared between calls.
+                    raise cls(
+                        **_forwarded_kwargs(typ, e, forward, dict(kwargs))
+                    )
+
+            return wrapper
+
+        return decorator
 
     @contextmanager
     def wrap_error(
@@ -232,7 +429,8 @@ class _EnumErrorsMeta(EnumMeta):
     #    and __qualname__ are originally set to the empty string because the
     #    name of the type is not yet accessible at EnumErrors.__new__).
     #    Additionally, the monkey-patched __init__ (see EnumErrors.__new__) is
-    #    overridden by the dataclass __init__).
+    #    overridden by the dataclass-like __init__), and __str__ is compiled
+    #    when possible.
     def __getitem__(cls, item: Any) -> Any:
         # noinspection PyUnresolvedReferences
         return cls.__class_getitem__(item)
@@ -246,11 +444,14 @@ class _EnumErrorsMeta(EnumMeta):
     ) -> Enum:
         result = super().__new__(mcs, name, bases, dct, **kwargs)
         for typ in result:
-            typ.__init__ = typ._original_init
+            typ.__init__ = _dataclass_methods(tuple(typ.attrs))['__init__']
+            # Names like _name_ are only available now that the enum has been
+            # created, so try to compile __str__ here.
+            if (str_method := _str_method(typ._value_[0], typ)) is not None:
+                typ.__str__ = str_method
             typ.__name__ = typ._name_
             typ.__qualname__ = f'{name}.{typ._name_}'
             typ.__str__.__qualname__ = f'{typ.__qualname__}.__str__'
-            delattr(typ, '_original_init')
         return result
 
 
@@ -1,17 +1,24 @@
+from __future__ import annotations
+
+import bisect
+import functools
 import itertools
 from collections.abc import Callable, Iterable, Mapping
 from contextlib import contextmanager
 from string import Formatter
-
-import pytest
-from _pytest._code import ExceptionInfo as PyTestExceptionInfo
+from typing import Final, Generic, TYPE_CHECKING
 
 from enough._exception import EnoughError
 from enough.enumerrors import EnumErrors
 from enough.types import E, T, T1, T2
 
-# Type of cycle information to format CircularDepError with.
-_CycleInfo = tuple[Iterable[T], T]
+if TYPE_CHECKING:
+    # pytest is only needed by raises, and importing it accounts for most of the
+    # time needed to import enough, so it is imported there instead.
+    from _pytest._code import ExceptionInfo as PyTestExceptionInfo
+
+# Used to parse format strings in format_fields.
+_FORMATTER: Final[Formatter] = Formatter()
 
 
 class EnoughFuncErrors(EnumErrors[EnoughError]):
@@ -24,55 +31,28 @@ class EnoughFuncErrors(EnumErrors[EnoughError]):
     )
 
 
-def _dag_stages_visit(
-    obj: T,
-    dependency_map: dict[T, set[T]],
-    visiting: set[T],
-    obj_to_stage: dict[T, int]
-) -> _CycleInfo | None:
-    # Visit object in a depth-first search fashion in order to calculate the dag
-    # stages.
-    # The returned tuple contains information about a detected cycle and is
-    # comprised of a partial path for which there is a cycle and the object
-    # which was twice visited. When this information is propagated upward,
-    # objects are appended to complete this path until we propagate to the
-    # twice-visited object (this is guaranteed to happen), after which the
-    # necessary information to describe the cycle has been gathered and a
-    # CircularDependencyException is raised.
-
-    # An object for which _dag_stages_visit is called should never be in visited
-    # or obj_to_stage.
-    assert obj not in visiting
-    assert obj not in obj_to_stage
-
-    stage = 0
-    visiting.add(obj)
-    for dep in dependency_map[obj]:
-        if dep not in obj_to_stage:
-            if dep in visiting:
-                # If we visit an object that has already been visited, that
-                # implies there is a cycle.
-                # Indicate a circular dependency by returning a value that will
-                # be used to build an error message.
-                return [obj, dep], dep
-            cycle_info = _dag_stages_visit(
-                dep, dependency_map, visiting, obj_to_stage
-            )
-            if cycle_info:
-                graph_path, twice_visited = cycle_info
-                graph_path = itertools.chain.from_iterable([[obj], graph_path])
-                if obj == twice_visited:
-                    graph_path = list(graph_path)
-                    # Should always be true.
-                    assert graph_path[-1] == obj
-                    raise EnoughFuncErrors.CircularDependency(graph_path)
-                # Keep propagating the cycle path.
-                return graph_path, twice_visited
-        stage = max(stage, obj_to_stage[dep] + 1)
-    visiting.remove(obj)
-    obj_to_stage[obj] = stage
-    del dependency_map[obj]
-    return None
+def _dag_stage_ids(
+    dependents: list[list[int]], num_deps: list[int]
+) -> list[list[int]]:
+    # Compute the stages for a dependency graph whose objects are represented by
+    # integer ids, where dependents[i] are the ids of the objects which depend
+    # on i and num_deps[i] is the number of dependencies of i. num_deps is
+    # updated in place, so that afterwards it is non-zero only for objects which
+    # could not be staged due to a circular dependency.
+    # Keeping this independent of the objects themselves means it only has to
+    # deal with lists of ints.
+    stage_ids = []
+    current = [obj_id for obj_id, num in enumerate(num_deps) if not num]
+    while current:
+        stage_ids.append(current)
+        nxt = []
+        for obj_id in current:
+            for dependent in dependents[obj_id]:
+                num_deps[dependent] -= 1
+                if not num_deps[dependent]:
+                    nxt.append(dependent)
+        current = nxt
+    return stage_ids
 
 
 def bounds(val: T, coll: Iterable[T]) -> tuple[T, T]:
@@ -89,15 +69,61 @@ def bounds(val: T, coll: Iterable[T]) -> tuple[T, T]:
     """
     max_lower = None
     min_upper = None
-    for x in coll:
+    it = iter(coll)
+    for x in it:
         if x <= val and (max_lower is None or x > max_lower):
             max_lower = x
         # Important not to use elif here in case x == val.
         if x >= val and (min_upper is None or x < min_upper):
             min_upper = x
+        if max_lower is not None and min_upper is not None:
+            # Once both bounds have been found, they no longer need to be
+            # checked against None for the remaining elements.
+            break
+    for x in it:
+        if max_lower < x <= val:
+            max_lower = x
+        if val <= x < min_upper:
+            min_upper = x
     return max_lower, min_upper
 
 
+class Bounds(Generic[T]):
+    """Sorted copy of a collection which may be used to repeatedly compute
+    bounds for values in it. ``Bounds(coll).query(val)`` is equivalent to
+    ``bounds(val, coll)``, but since the collection is sorted only once, each
+    query takes logarithmic rather than linear time.
+    """
+    __slots__ = '_sorted',
+
+    # The collection elements in sorted order.
+    _sorted: list[T]
+
+    def __init__(self, coll: Iterable[T]) -> None:
+        """Initialize this with the collection to get bounds in.
+
+        :param coll: Collection to get bounds in.
+        """
+        self._sorted = sorted(coll)
+
+    def query(self, val: T) -> tuple[T, T]:
+        """Determine the upper and lower bounds of the given value in the
+        collection this was initialized with.
+
+        :param val: Value to get bounds for.
+        :return: (lower bound or ``None`` if ``val`` is less than all elements,
+            upper bound or ``None`` if ``val`` is greater than all elements)
+        """
+        elements = self._sorted
+        index = bisect.bisect_left(elements, val)
+        upper = elements[index] if index < len(elements) else None
+        if upper is not None and upper <= val:
+            # upper is the least element which is at least val, so if it is
+            # also at most val, val is in the collection and bounds itself.
+            return upper, upper
+        return elements[index - 1] if index else None, upper
+
+
 def concat(seq1: Iterable[T], seq2: Iterable[T]) -> list[T]:
     """Concatenates two iterables into a single ``list``.
 
@@ -105,7 +131,11 @@ def concat(seq1: Iterable[T], seq2: Iterable[T]) -> list[T]:
     :param seq2: Second iterable.
     :return: The resulting ``list``.
     """
-    return list(itertools.chain.from_iterable([seq1, seq2]))
+    # Copying the first iterable and extending with the second avoids the
+    # per-element overhead of iterating over a chain.
+    result = list(seq1)
+    result.extend(seq2)
+    return result
 
 
 def dag_stages(dependency_map: Mapping[T, Iterable[T]]) -> list[set[T]]:
@@ -118,41 +148,52 @@ def dag_stages(dependency_map: Mapping[T, Iterable[T]]) -> list[set[T]]:
     :raise EnoughError: If any objects in ``dependency_map`` are mutually
         dependent.
     """
-
-    # This will be a mapping from objects to their stage index.
-    obj_to_stage = {}
-    all_objects = set()
-    new_dep_map = {}
+    # The stages are computed using Kahn's algorithm: the first stage consists
+    # of all objects without dependencies, and each subsequent stage consists of
+    # the objects whose last remaining dependencies were in the previous stage.
+    # Each object is assigned an integer id so that the graph may be
+    # represented using lists indexed by those ids.
+    ids = {}
+    dep_ids = []
     for obj, deps in dependency_map.items():
-        all_objects.add(obj)
-        [all_objects.add(o) for o in deps]
-        if not deps:
-            # May as well go ahead and init the depth for this object at 0. Also
-            # consisted for how unlisted objects are treated.
-            obj_to_stage[obj] = 0
-        else:
-            new_dep_map[obj] = set(deps)
-    for obj in all_objects - dependency_map.keys():
-        # Treat unlisted objects (those not in dependency_map) as having no
-        # dependencies.
-        obj_to_stage[obj] = 0
-    visiting = set()  # Nodes we are in the process of visiting.
-
-    while new_dep_map:
-        obj = next(iter(new_dep_map))
-        # A CircularDependencyError should have been raised if the cycle info is
-        # not None.
-        assert (
-            _dag_stages_visit(obj, new_dep_map, visiting, obj_to_stage) is None
-        )
-
-    # Use obj_to_stage to create the stages.
-    stages = []
-    for obj, stage in obj_to_stage.items():
-        for _ in range(len(stages), stage + 1):
-            stages.append(set())
-        stages[stage].add(obj)
-    return stages
+        # Unlisted objects (those not in dependency_map) are treated as having
+        # no dependencies.
+        obj_id = ids.setdefault(obj, len(ids))
+        obj_dep_ids = {ids.setdefault(dep, len(ids)) for dep in deps}
+        while len(dep_ids) < len(ids):
+            dep_ids.append(set())
+        dep_ids[obj_id] = obj_dep_ids
+    objs = list(ids)
+
+    # Mapping from ids to the ids of the objects which depend on them.
+    dependents = [[] for _ in objs]
+    # Number of dependencies of each object which have not yet been staged.
+    num_deps = []
+    for obj_id, obj_dep_ids in enumerate(dep_ids):
+        for dep_id in obj_dep_ids:
+            dependents[dep_id].append(obj_id)
+        num_deps.append(len(obj_dep_ids))
+
+    stage_ids = _dag_stage_ids(dependents, num_deps)
+    if sum(len(stage) for stage in stage_ids) < len(objs):
+        # Every object which could not be staged has a dependency which also
+        # could not be staged, so following those dependencies from any such
+        # object must eventually lead to a cycle.
+        path = [next(obj_id for obj_id, num in enumerate(num_deps) if num)]
+        path_index = {path[0]: 0}
+        while True:
+            dep_id = next(
+                dep_id for dep_id in dep_ids[path[-1]] if num_deps[dep_id]
+            )
+            if dep_id in path_index:
+                cycle = path[path_index[dep_id]:]
+                cycle.append(dep_id)
+                raise EnoughFuncErrors.CircularDependency(
+                    [objs[obj_id] for obj_id in cycle]
+                )
+            path_index[dep_id] = len(path)
+            path.append(dep_id)
+    return [{objs[obj_id] for obj_id in stage} for stage in stage_ids]
 
 
 def flatten(coll: Iterable[Iterable[T]]) -> Iterable[T]:
@@ -162,26 +203,27 @@ def flatten(coll: Iterable[Iterable[T]]) -> Iterable[T]:
     :param coll: Collection to flatten.
     :return: The flattened collection.
     """
-    return [x for items in coll for x in items]
+    return list(itertools.chain.from_iterable(coll))
 
 
-def format_fields(fmt: str) -> set[str]:
-    """Returns the names of all format fields in ``fmt``.
+@functools.lru_cache(maxsize=1024)
+def format_fields(fmt: str) -> frozenset[str]:
+    """Returns the names of all format fields in ``fmt``. Results are cached, so
+    repeatedly finding the fields of the same format string is cheap.
 
     :param fmt: String to find format fields for.
     :return: The found fields.
     """
-    return {
-        field for _, field, _, _ in format_fields.formatter.parse(fmt)
-        if field is not None
-    }
-
-
-format_fields.formatter = Formatter()
+    return frozenset(
+        field for _, field, _, _ in _FORMATTER.parse(fmt) if field is not None
+    )
 
 
+@functools.lru_cache(maxsize=1024)
 def fqln(cls: type) -> str:
-    """Gets the fully-qualified name for a class.
+    """Gets the fully-qualified name for a class. Results are cached, so changes
+    to ``__module__`` or ``__qualname__`` of a class after its name has been
+    retrieved will not be reflected.
 
     :param cls: Class to get fully-qualified name for.
     :return: The fully-qualified name for the class.
@@ -217,9 +259,14 @@ def format_table(
     :param val_fn: Function to use to map elements.
     :return: The formatted table.
     """
+    # Only map keys and elements when functions other than the default identity
+    # function are given.
+    if key_fn is not identity:
+        table = ((key_fn(k), values) for k, values in table)
+    if val_fn is not identity:
+        table = ((k, map(val_fn, values)) for k, values in table)
     return row_sep.join(
-        f'{key_fn(k)}{key_sep}{col_sep.join(str(val_fn(v)) for v in values)}'
-        for k, values in table
+        f'{k}{key_sep}{col_sep.join(map(str, values))}' for k, values in table
     )
 
 
@@ -239,8 +286,13 @@ def raises(
     :param kwargs: Keyword arguments to pass to ``pytest.raises``.
     :return: The ``pytest`` exception info object.
     """
-    exc_type = type(exc) if isinstance(exc, Exception) else exc
-    with pytest.raises(exc_type, *args, **kwargs) as exc_info:
+    import pytest
+    if not isinstance(exc, Exception):
+        # Just an exception type, no need to check equality.
+        with pytest.raises(exc, *args, **kwargs) as exc_info:
+            yield exc_info
+        return
+    with pytest.raises(type(exc), *args, **kwargs) as exc_info:
         yield exc_info
-    if isinstance(exc, Exception) and exc_info.value != exc:
+    if exc_info.value != exc:
         raise AssertionError(f'{exc_info.value!r} was not equal to {exc!r}')
@@ -1,69 +1,157 @@
 import os
 import shutil
+import stat
 
 from collections.abc import Iterator
 from contextlib import contextmanager
-from tempfile import NamedTemporaryFile
-from typing import Any
+from tempfile import NamedTemporaryFile, mkdtemp, mkstemp
+from typing import Any, Final
+
+# Message for the PermissionError raised when rm refuses to remove a single
+# write-protected file.
+_RM_PROTECTED_FILE_MSG: Final[str] = (
+    'Refusing to remove write-protected file {path} (use force=True to delete '
+    'anyway).'
+)
+
+# Message for the PermissionError raised when rm refuses to remove some files in
+# a directory tree.
+_RM_PROTECTED_FILES_MSG: Final[str] = (
+    'Refusing to remove {num_protected} write-protected file{s_maybe1} (use '
+    'force=True to delete anyway).\n'
+    'Note: {num_not_protected} non-protected file{s_maybe2} were removed.'
+)
+
+# Keyword arguments to temp_file_path which mkstemp accepts in the same way as
+# NamedTemporaryFile.
+_MKSTEMP_KWARGS: Final[frozenset[str]] = frozenset({'suffix', 'prefix', 'dir'})
+
+# Whether os.access can check a symbolic link itself rather than its target.
+_ACCESS_NO_FOLLOW: Final[bool] = os.access in os.supports_follow_symlinks
+
+
+def _writable(path: str) -> bool:
+    # Determine whether path is writable for the purposes of rm. Symbolic links
+    # are checked themselves rather than their targets, since removing a link
+    # does not affect what it points to (which may not even exist).
+    if _ACCESS_NO_FOLLOW:
+        return os.access(path, os.W_OK, follow_symlinks=False)
+    return os.path.islink(path) or os.access(path, os.W_OK)
 
 
 def _rm_prompts(force: bool, path: str) -> bool:
-    return not force and os.path.exists(path) and not os.access(path, os.W_OK)
+    # Check _writable first: os.path.exists only needs to be checked to rule out
+    # a missing file when it fails, so normally only one call is made.
+    return not force and not _writable(path) and os.path.exists(path)
 
 
 def ls_recursive(path: str) -> Iterator[str]:
-    if os.path.isfile(path):
-        yield path
-    else:
-        for pth in os.listdir(path):
-            yield from ls_recursive(os.path.join(path, pth))
+    # Walk the tree iteratively rather than recursively, yielding each directory
+    # after its contents. os.scandir is used so that whether an entry is a
+    # directory can usually be determined without an additional stat call.
+    # Symbolic links to directories are yielded rather than followed.
+    try:
+        entries = os.scandir(path)
+    except NotADirectoryError:
         yield path
+        return
+    # Each element is a directory being listed and an iterator over its entries.
+    stack = [(path, entries)]
+    try:
+        while stack:
+            dir_path, entries = stack[-1]
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, os.scandir(entry.path)))
+                    break
+                yield entry.path
+            else:
+                stack.pop()
+                entries.close()
+                yield dir_path
+    finally:
+        # Close any iterators left open if this generator was not exhausted.
+        for _, entries in stack:
+            entries.close()
 
 
 def replace(src: str, dest: str) -> bool:
-    existed = rm(dest, recursive=True, force=True)
-    os.rename(src, dest)
-    return existed
+    # os.replace overwrites a file with a file by itself (atomically), so only
+    # remove dest first when it is a directory, or when os.replace refuses to
+    # overwrite it because src is a directory.
+    try:
+        dest_mode = os.lstat(dest).st_mode
+    except FileNotFoundError:
+        os.replace(src, dest)
+        return False
+    if stat.S_ISDIR(dest_mode):
+        rm(dest, recursive=True, force=True)
+        os.replace(src, dest)
+        return True
+    try:
+        os.replace(src, dest)
+    except NotADirectoryError:
+        rm(dest, force=True)
+        os.replace(src, dest)
+    return True
 
 
 def rm(path: str, recursive: bool = False, force: bool = False) -> bool:
     if recursive:
-        if force:
-            try:
-                if os.path.isdir(path):
-                    shutil.rmtree(path)
-                else:
-                    os.remove(path)
-            except FileNotFoundError:
+        # Use lstat rather than os.path.isdir so that a symbolic link, even one
+        # to a directory, is removed itself: shutil.rmtree refuses to remove
+        # links, and ls_recursive would list the contents of the link's target.
+        try:
+            is_dir = stat.S_ISDIR(os.lstat(path).st_mode)
+        except FileNotFoundError:
+            if force:
                 return False
+            raise
+        # Paths which must be writable for everything to be removed at once.
+        # Collect them all before removing any, since how os.scandir behaves
+        # when a directory being scanned is modified is unspecified. Normalize
+        # path so that it is the same as the directory names of the paths
+        # directly under it. Nothing needs to be checked when force is given.
+        paths = (
+            () if force
+            else list(ls_recursive(os.path.normpath(path))) if is_dir
+            else [path]
+        )
+        if all(_writable(pth) for pth in paths):
+            # Nothing is write-protected, so remove everything at once.
+            if is_dir:
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
         else:
             num_write_protected = 0
             num_not_write_protected = 0
-            for pth in ls_recursive(path):
-                if os.access(pth, os.W_OK):
+            # Directories which cannot be removed because they (indirectly)
+            # contain write-protected files.
+            kept = set()
+            for pth in paths:
+                if pth in kept:
+                    kept.add(os.path.dirname(pth))
+                elif _writable(pth):
                     num_not_write_protected += 1
-                    if os.path.isdir(path):
-                        os.rmdir(path)
+                    # Use a single lstat rather than both os.path.isdir and
+                    # os.path.islink.
+                    if stat.S_ISDIR(os.lstat(pth).st_mode):
+                        os.rmdir(pth)
                     else:
-                        # If the file does not exist os.remove raise the
-                        # FileNotFoundError instead of us.
-                        os.remove(path)
+                        os.remove(pth)
                 else:
                     num_write_protected += 1
+                    kept.add(os.path.dirname(pth))
             if num_write_protected:
-                s_maybe1 = 's' if num_write_protected != 1 else ''
-                s_maybe2 = 's' if num_not_write_protected != 1 else ''
-                raise PermissionError(
-                    f'Refusing to remove {num_write_protected} write-protected '
-                    f'file{s_maybe1} (use force=True to delete anyway).\n'
-                    f'Note: {num_not_write_protected} non-protected'
-                    f'file{s_maybe2} were removed.'
-                )
-    elif not force and os.path.exists(path) and not os.access(path, os.W_OK):
-        raise PermissionError(
-            f'Refusing to remove write-protected file {path} (use force=True '
-            f'to delete anyway).'
-        )
+                raise PermissionError(_RM_PROTECTED_FILES_MSG.format(
+                    num_protected=num_write_protected,
+                    s_maybe1='s' if num_write_protected != 1 else '',
+                    num_not_protected=num_not_write_protected,
+                    s_maybe2='s' if num_not_write_protected != 1 else ''
+                ))
+    elif _rm_prompts(force, path):
+        raise PermissionError(_RM_PROTECTED_FILE_MSG.format(path=path))
     else:
         # If path is a directory or it does not exist, let os.remove raise the
         # IsADirectoryError or FileNotFoundError respectively.
@@ -77,17 +165,30 @@ def rm(path: str, recursive: bool = False, force: bool = False) -> bool:
 
 
 def swap(path1: str, path2: str) -> None:
-    with temp_file_path() as temp_path:
-        os.remove(temp_path)
+    # Move path1 into a new, uniquely named directory next to it while path2 is
+    # moved to path1. mkdtemp creates the directory atomically, so nothing
+    # already present (such as what is left by an interrupted swap) can be
+    # overwritten. Putting it in the same directory as path1 also ensures it is
+    # on the same file system.
+    temp_dir = mkdtemp(
+        prefix='.swap-', dir=os.path.dirname(path1) or os.curdir
+    )
+    temp_path = os.path.join(temp_dir, 'swap')
+    try:
         # May result in FileNotFoundError, let it propagate if so.
         os.rename(path1, temp_path)
-        try:
-            os.rename(path2, path1)
-        except FileNotFoundError:
-            # Try to undo what we did.
-            os.rename(temp_path, path1)
-            raise
-        os.rename(temp_path, path2)
+    except BaseException:
+        os.rmdir(temp_dir)
+        raise
+    try:
+        os.rename(path2, path1)
+    except FileNotFoundError:
+        # Try to undo what we did.
+        os.rename(temp_path, path1)
+        os.rmdir(temp_dir)
+        raise
+    os.rename(temp_path, path2)
+    os.rmdir(temp_dir)
 
 
 @contextmanager
@@ -105,13 +206,20 @@ def temp_file_path(*args: Any, delete: bool = True, **kwargs: Any) -> str:
     :param kwargs: Keyword arguments to pass to ``tempfile.NamedTemporaryFile``.
     :return: Path to the created file. This file is not open for writing.
     """
-    temp = NamedTemporaryFile(*args, **kwargs, delete=False)
-    temp.close()
+    if not args and _MKSTEMP_KWARGS.issuperset(kwargs):
+        # The file is closed right away, so when no arguments concerning how it
+        # is opened are given, use mkstemp to avoid creating a file object.
+        fd, path = mkstemp(**kwargs)
+        os.close(fd)
+    else:
+        temp = NamedTemporaryFile(*args, **kwargs, delete=False)
+        temp.close()
+        path = temp.name
     try:
-        yield temp.name
+        yield path
     finally:
         if delete:
             try:
-                os.remove(temp.name)
+                os.remove(path)
             except FileNotFoundError:
                 pass
@@ -1,5 +1,5 @@
 import importlib
-import inspect
+import sys
 from types import ModuleType
 from typing import Final, TypeGuard
 
@@ -20,6 +20,10 @@ _IGNORED_MEMBERS: Final[frozenset[str]] = frozenset({
     '__spec__'
 })
 
+# Cache of objects imported by import_object, keyed by their fully-qualified
+# names. Failed imports are not cached.
+_IMPORTED: Final[dict[str, object]] = {}
+
 
 class EnoughImportsErrors(EnumErrors[EnoughError]):
     """Exception types raised in enough.importfns."""
@@ -58,7 +62,9 @@ def checked_import(fqln: str, predicate: TypeGuard[T]) -> T:
 
 
 def import_object(fqln: str) -> object:
-    """Imports an object with the given name.
+    """Imports an object with the given name. Successfully imported objects are
+    cached by name, so reloading a module or reassigning the object in its
+    module after it has been imported will not be reflected.
 
     :param fqln: Fully-qualified name of the object to import.
     :return: The imported object.
@@ -66,15 +72,30 @@ def import_object(fqln: str) -> object:
         imported, or if the module could be imported but the object could not be
         found.
     """
+    if fqln in _IMPORTED:
+        return _IMPORTED[fqln]
     module_name, object_name = fqln.rsplit('.', maxsplit=1)
-    with EnoughImportsErrors.ModuleImport.wrap_error(
-        Exception, name=module_name
-    ):
-        module = importlib.import_module(module_name)
-    with EnoughImportsErrors.ObjectNotFound.wrap_error(
-        AttributeError, dest=None, name=object_name, module=module
+    # Skip the import machinery (and its lock) for modules which have already
+    # been imported. A module which is still being initialized (possibly by
+    # another thread) is left to import_module, which waits for it to finish.
+    module = sys.modules.get(module_name)
+    # Use try/except rather than wrap_error: this function may be called many
+    # times (e.g., while loading configuration), and the context managers add
+    # overhead to every call.
+    if module is None or getattr(
+        getattr(module, '__spec__', None), '_initializing', False
     ):
-        return getattr(module, object_name)
+        try:
+            module = importlib.import_module(module_name)
+        except Exception as e:
+            raise EnoughImportsErrors.ModuleImport(name=module_name, error=e)
+    try:
+        obj = _IMPORTED[fqln] = getattr(module, object_name)
+    except AttributeError:
+        raise EnoughImportsErrors.ObjectNotFound(
+            name=object_name, module=module
+        )
+    return obj
 
 
 def module_members(module: ModuleType, predicate: TypeGuard[T]) -> list[T]:
@@ -85,20 +106,23 @@ def module_members(module: ModuleType, predicate: TypeGuard[T]) -> list[T]:
 
     :param module: Module to find members in.
     :param predicate: Predicate to satisfy.
-    :return: The members of ``module`` satisfying ``predicate``.
+    :return: The members of ``module`` satisfying ``predicate``, in the order
+        they were added to the module.
     """
+    module_name = module.__name__
+    # Iterate over the module's namespace directly rather than using dir(),
+    # which sorts its names and requires a getattr for each of them.
     return [
-        member for name, member in inspect.getmembers(module, predicate)
+        member for name, member in vars(module).items()
         if (
-            # Ignore members like __doc__ which are found in every module.
-            name not in _IGNORED_MEMBERS
-
+            # Ignore members like __doc__ which are found in every module so
+            # that predicate is not called for them. All of these names start
+            # with "__", so most names only need the prefix check.
+            (not name.startswith('__') or name not in _IGNORED_MEMBERS)
             # Use __module__ to determine if the member was originally defined
             # in this module. Assume this is the case if the __module__
             # attribute is not present.
-            and getattr(
-                member, '__module__', module.__name__
-            ) == module.__name__
+            and getattr(member, '__module__', module_name) == module_name
             and predicate(member)
         )
     ]
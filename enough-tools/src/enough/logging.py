@@ -1,9 +1,9 @@
+import bisect
 import logging
 from collections.abc import Callable, Mapping
 from logging import Handler, LogRecord, Logger, LoggerAdapter
 from typing import Any
 
-import enough
 from enough._exception import EnoughError
 from enough.enumerrors import EnumErrors
 
@@ -41,17 +41,24 @@ class FnLoggingHandler(Handler):
         self.fn(self.format(record))
 
 
-class SplitLevelLogger(LoggerAdapter):
+class SplitLevelLogger(Logger):
     """Logger subclass which delegates logging to multiple other loggers based
     on the level of the message. Assumes that the number of unique levels logged
     with does not grow without bound, otherwise this is a very inefficient
     implementation.
     """
 
+    #: Logger with this logger's name, which determines whether a level is
+    #: enabled.
+    logger: Logger
+
     #: Mapping from level to logger to use. Updated as logs are attempted with
     #: more levels.
     level_to_logger: dict[int, Logger]
 
+    # Sorted levels which were configured when this logger was created.
+    _levels: list[int]
+
     def __init__(
         self, name: str, level_to_logger: Mapping[int, Logger | LoggerAdapter]
     ) -> None:
@@ -65,26 +72,69 @@ class SplitLevelLogger(LoggerAdapter):
         """
         if not level_to_logger:
             raise EnoughLoggingErrors.EmptyMap()
-        super().__init__(logging.getLogger(name), None)
+        super().__init__(name)
+        self.logger = logging.getLogger(name)
         self.level_to_logger = dict(level_to_logger)
+        self._levels = sorted(level_to_logger)
         # Ignore levels set in given loggers.
-        [logger.setLevel(1) for logger in level_to_logger.values()]
-
-    def log(self, level: int, msg: str, *args: Any, **kwargs: Any) -> None:
-        # Overwrite this log function to delegate to other loggers.
-        if self.isEnabledFor(level):
-            logger = self.level_to_logger.get(level)
-            if not logger:
-                # Find the logger corresponding to the greatest lower bound for
-                # level in level_to_logger.
-                glb = enough.bounds(level, self.level_to_logger)[0]
-                if glb is None:
-                    # This level is lower than any other configured level. In
-                    # this case, use the lowest level.
-                    logger = self.level_to_logger[min(self.level_to_logger)]
-                else:
-                    logger = self.level_to_logger[glb]
-                # Update the level mapping so we don't have to do this
-                # calculation again.
-                self.level_to_logger[level] = logger
-            logger.log(level, msg, *args, **kwargs)
+        for logger in level_to_logger.values():
+            logger.setLevel(1)
+        # Resolve the standard levels up front, since they are the most likely
+        # to be logged with.
+        for level in (
+            logging.DEBUG,
+            logging.INFO,
+            logging.WARNING,
+            logging.ERROR,
+            logging.CRITICAL
+        ):
+            if level not in self.level_to_logger:
+                self.level_to_logger[level] = self._logger_for(level)
+
+    def _logger_for(self, level: int) -> Logger:
+        # Find the logger corresponding to the greatest lower bound for level in
+        # the configured levels.
+        index = bisect.bisect_right(self._levels, level) - 1
+        # If index is -1, this level is lower than any other configured level.
+        # In this case, use the lowest level.
+        return self.level_to_logger[self._levels[max(index, 0)]]
+
+    # Levels are managed by the logger with this logger's name, as they were
+    # when this class was a LoggerAdapter.
+    def setLevel(self, level: int | str) -> None:
+        self.logger.setLevel(level)
+
+    def getEffectiveLevel(self) -> int:
+        return self.logger.getEffectiveLevel()
+
+    def isEnabledFor(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
+
+    def _log(
+        self,
+        level: int,
+        msg: object,
+        args: Any,
+        exc_info: Any = None,
+        extra: Mapping[str, object] | None = None,
+        stack_info: bool = False,
+        stacklevel: int = 1
+    ) -> None:
+        # Overwrite this log function to delegate to other loggers. Logger's
+        # logging methods only call this once the level is known to be enabled.
+        level_to_logger = self.level_to_logger
+        logger = level_to_logger.get(level)
+        if logger is None:
+            # Update the level mapping so we don't have to do this calculation
+            # again.
+            logger = level_to_logger[level] = self._logger_for(level)
+        # Increment stacklevel so the caller is found outside of this frame.
+        logger.log(
+            level,
+            msg,
+            *args,
+            exc_info=exc_info,
+            extra=extra,
+            stack_info=stack_info,
+            stacklevel=stacklevel + 1
+        )
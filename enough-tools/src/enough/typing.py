@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import typing
 from collections import *
 from collections.abc import *
@@ -15,6 +16,7 @@ from typing import (
     ParamSpec,
     TypeVar
 )
+from weakref import WeakKeyDictionary
 
 from enough._exception import EnoughError
 from enough.enumerrors import EnumErrors
@@ -60,6 +62,16 @@ T3 = TypeVar('T3')
 P = ParamSpec('P')
 TP = TypeVar('TP')
 
+# Types of special typing objects, computed once here rather than wherever they
+# are needed.
+# Type of the unparameterized aliases for standard library collections defined
+# in typing, like List and Dict (typing._SpecialGenericAlias).
+_SPECIAL_GENERIC_ALIAS = type(List)
+# Type of Any.
+_ANY_TYPE = type(Any)
+# Type of Concatenate.
+_CONCAT_TYPE = type(Concatenate)
+
 # Type of a generic alias which includes both user-defined and standard library
 # aliases.
 GeneralAlias = _BaseGenericAlias | GenericAlias
@@ -89,7 +101,7 @@ GenericType = type[
 ]
 
 # Type of an entity that can (sanely) be used as a type argument for a TypeVar.
-TypeVarArg = type[object] | GeneralAlias | TypeVar | type(Any)
+TypeVarArg = type[object] | GeneralAlias | TypeVar | _ANY_TYPE
 
 # Type of an entity that can (sanely) be used as a type argument for ParamSpec.
 ParamSpecArg = (
@@ -97,7 +109,7 @@ ParamSpecArg = (
     | list[TypeVarArg]
     | EllipsisType
     | ParamSpec
-    | type(Concatenate)
+    | _CONCAT_TYPE
 )
 
 # Type of an entity that represents sane type arguments to supply to a tuple.
@@ -166,33 +178,50 @@ IMPLICIT_BASES: (
     defaultdict: dict[T1, T2]
 }
 
+# Types in IMPLICIT_BASES which take type arguments, i.e., those with bases that
+# are parameterized with type variables. This is precomputed so that is_generic
+# does not need to create Assignments for them.
+_IMPLICIT_GENERICS: Final[frozenset[type[object]]] = frozenset(
+    typ for typ, bases in IMPLICIT_BASES.items()
+    if any(
+        getattr(base, '__parameters__', ())
+        for base in (bases if isinstance(bases, tuple) else (bases,))
+    )
+)
+
 # Types whose assignments should be inherited from subclasses even if they don't
 # appear in that class's mro (e.g., they are subclasses via a subclass hook).
 HOOK_DEFAULTS: Final[tuple[TypeOrAlias, ...]] = ItemsView,
 
+# Pairs of the origin of each type in HOOK_DEFAULTS along with that type.
+_HOOK_ORIGINS: Final[tuple[tuple[type[object], TypeOrAlias], ...]] = tuple(
+    (typing.get_origin(hook_default) or hook_default, hook_default)
+    for hook_default in HOOK_DEFAULTS
+)
+
+# The functions below manipulate typing objects (type variables, ParamSpecs and
+# aliases), which JIT compilers like Numba cannot work with. To speed up type
+# argument inference, extend the caching used here instead (see clear_caches).
+
 
 def all_vars(args: ProcessedArgs) -> TypeVariables:
-    # Get all the unique parameters in order for each arg in args.
-    seen = set()
-    parameters = []
-    for arg in args:
-        for p in get_vars(arg):
-            if p not in seen:
-                seen.add(p)
-                parameters.append(p)
-    return tuple(parameters)
+    # Get all the unique parameters in order for each arg in args. dict.fromkeys
+    # removes duplicates while preserving order.
+    return tuple(dict.fromkeys(p for arg in args for p in get_vars(arg)))
 
 
 def apply(
     typ: GenericType, args: ProcessedArgs, vrs: TypeVariables
 ) -> ParameterizedAlias:
     # Apply the given processed arguments to typ.
-    # Prepare each argument so it is ready to be used in a type argument list.
-    args = tuple(unprocess(arg) for arg in args)
     if typ is tuple:
+        # Only the first argument is used for tuples, so only unprocess that.
         # noinspection PyTypeChecker
-        return tuple[args[0]]
-    return typ[tuple(prepare(arg, var) for arg, var in zip(args, vrs))]
+        return tuple[unprocess(args[0])]
+    # Prepare each argument so it is ready to be used in a type argument list.
+    return typ[
+        tuple(prepare(unprocess(arg), var) for arg, var in zip(args, vrs))
+    ]
 
 
 def clean(args: tuple[TypeVarArg | ProcessedArg, ...]) -> ProcessedArg:
@@ -217,12 +246,16 @@ def clean(args: tuple[TypeVarArg | ProcessedArg, ...]) -> ProcessedArg:
 
 
 def ensure_tuple(arg: T1) -> T1 | tuple[T1]:
-    # Ensure that the given argument is a tuple.
+    # Ensure that the given argument is a tuple. get_vars, sub and unprocess
+    # inline this for processed arguments, which are only ever exact tuples.
     return arg if isinstance(arg, tuple) else (arg,)
 
 
+@functools.lru_cache(maxsize=1024)
 def get_vars(arg: ProcessedArg) -> tuple[TypeVariable, ...]:
-    # Get all the type parameters appearing in arg in order.
+    # Get all the type parameters appearing in arg in order. Since constructing
+    # Concatenate is expensive and the same arguments are inspected many times
+    # while creating Assignments, the results are cached.
     # To accomplish this, arg, which is a tuple, is expanded inside a
     # Concatenate between two instances of _P. The first instance of _P ensures
     # that the first parameter found is _P, allowing us to easily ignore it,
@@ -230,17 +263,14 @@ def get_vars(arg: ProcessedArg) -> tuple[TypeVariable, ...]:
     # The second instance of _P ensures that the argument list ends in
     # ParamSpec, without which the Concatenation will fail to be created.
     # [1:] discards the _P parameter.
-    return Concatenate[(_P, *ensure_tuple(arg), _P)].__parameters__[1:]
+    return Concatenate[
+        (_P, *(arg if type(arg) is tuple else (arg,)), _P)
+    ].__parameters__[1:]
 
 
 def has_args(typ: TypeOrAlias) -> bool:
     # Determine if the given argument is a generic type alias with arguments.
-    # "isinstance(base, type(List))" tests if base is a "_SpecialGenericAlias",
-    # the type of type aliases for builtin collections. In this case, we want to
-    # treat base as though no type arguments were given.
-    return (
-        typing.get_origin(typ) is not None and not isinstance(typ, type(List))
-    )
+    return type_arg_split(typ)[1] is not None
 
 
 def is_generic(typ: type[object]) -> bool:
@@ -251,7 +281,7 @@ def is_generic(typ: type[object]) -> bool:
     return (
         typ is type
         or typ is tuple
-        or (typ in IMPLICIT_BASES and bool(Assignments.get(typ).vars))
+        or typ in _IMPLICIT_GENERICS
         or (
             issubclass(typ, Generic)
             and bool(getattr(typ, '__parameters__', ()))
@@ -264,6 +294,7 @@ def join(src: TypeAssignments, dest: TypeAssignments) -> TypeAssignments:
     return src | {var: sub_map(src, arg) for var, arg in dest.items()}
 
 
+@functools.lru_cache(maxsize=1024)
 def orig_bases(typ: type[object]) -> tuple[TypeOrAlias, ...]:
     # Get typ.__orig_bases__ if it gave type arguments to its parameters.
     # Otherwise, get typ.__bases__ (note that typ.__orig_bases__ will be those
@@ -282,14 +313,15 @@ def orig_bases(typ: type[object]) -> tuple[TypeOrAlias, ...]:
         bases = typ.__orig_bases__
     else:
         bases = typ.__bases__
-    # noinspection PyArgumentList
-    mro = set(typ.mro(typ) if issubclass(typ, type) else typ.mro())
-    bases_to_add = []
-    for hook_default in HOOK_DEFAULTS:
-        origin = typing.get_origin(hook_default) or hook_default
-        if origin not in mro and issubclass(typ, origin):
-            bases_to_add.append(hook_default)
-    return bases + tuple(bases_to_add)
+    if not _HOOK_ORIGINS:
+        return bases
+    # Unlike typ.mro(), __mro__ is already computed, and it works the same for
+    # metaclasses as for other types.
+    mro = set(typ.__mro__)
+    return bases + tuple(
+        hook_default for origin, hook_default in _HOOK_ORIGINS
+        if origin not in mro and issubclass(typ, origin)
+    )
 
 
 def prepare(arg: TypeArgs, var: TypeVariable) -> TypeArg:
@@ -305,10 +337,22 @@ def _process(arg: TypeArg) -> ProcessedArg:
     # It also allows us to treat all type parameter arguments as the same up to
     # the point before we actually need to substitute them in a type argument
     # list.
+    # Lists are processed the same way as tuples, so convert them to tuples to
+    # allow the result to be cached.
+    return _process_hashable(tuple(arg) if isinstance(arg, list) else arg)
+
+
+@functools.lru_cache(maxsize=1024)
+def _process_hashable(arg: TypeArg) -> ProcessedArg:
+    # Implementation of _process for hashable arguments.
     if typing.get_origin(arg) is Concatenate:
         return _process(typing.get_args(arg))
-    if isinstance(arg, (list, tuple)):
-        # Substitute all ellipses for _P and clean the resulting tuple.
+    if isinstance(arg, tuple):
+        # Substitute all ellipses for _P and clean the resulting tuple. Most
+        # arguments do not contain ellipses, in which case there is nothing to
+        # substitute.
+        if ... not in arg:
+            return clean(arg)
         return clean(tuple(_P if a is ... else a for a in arg))
     if arg is ...:
         return _P
@@ -326,6 +370,7 @@ def process(
     return sub(tuple(proxies.get(var, var) for var in vrs), processed)
 
 
+@functools.lru_cache(maxsize=4096)
 def sub(args: ProcessedArgs, target: ProcessedArg) -> ProcessedArg:
     # Substitute the given arguments for the type parameters in target.
     # Like params above, this uses a trick of expanding the arguments inside
@@ -338,7 +383,9 @@ def sub(args: ProcessedArgs, target: ProcessedArg) -> ProcessedArg:
         return target
     result = clean(
         typing.get_args(
-            Concatenate[(_P, *ensure_tuple(target), _P)][(_P, *args)]
+            Concatenate[
+                (_P, *(target if type(target) is tuple else (target,)), _P)
+            ][(_P, *args)]
         )[1:-1]
     )
     if not isinstance(target, tuple):
@@ -349,26 +396,35 @@ def sub(args: ProcessedArgs, target: ProcessedArg) -> ProcessedArg:
 def sub_map(assignments: TypeAssignments, target: ProcessedArg) -> ProcessedArg:
     # Like sub, but uses a mapping from variables to arguments and infers uses
     # that to infer the order in which to pass the arguments.
-    return (sub(
-        tuple(assignments.get(var, var) for var in get_vars(target)),
-        target
-    ))
+    vrs = get_vars(target)
+    if not vrs:
+        # Nothing to substitute: skip building the arguments and calling sub.
+        return target
+    return sub(tuple(assignments.get(var, var) for var in vrs), target)
 
 
+@functools.lru_cache(maxsize=2048)
 def type_arg_split(typ: TypeOrAlias) -> tuple[type[object], TypeArgs | None]:
     # Split the given type or alias into the origin type and the type arguments,
-    # or None if there aren't any.
+    # or None if there aren't any. The results are cached since this is done
+    # for every base of every type Assignments are created for.
+    # "isinstance(typ, _SPECIAL_GENERIC_ALIAS)" tests if typ is an alias like
+    # List, the type of type aliases for builtin collections. In this case, we
+    # want to treat typ as though no type arguments were given.
     origin = typing.get_origin(typ)
-    if origin is None or isinstance(typ, type(List)):
+    if origin is None or isinstance(typ, _SPECIAL_GENERIC_ALIAS):
         # noinspection PyTypeChecker
         return origin or typ, None
     return origin, typing.get_args(typ)
 
 
+@functools.lru_cache(maxsize=1024)
 def unprocess(arg: ProcessedArg) -> TypeArgs:
     # Undo the processing logic (replace _P with ...) to prepare the argument
     # for parameterization of a type.
-    return tuple(x if x != _P else ... for x in ensure_tuple(arg))
+    return tuple(
+        x if x != _P else ... for x in (arg if type(arg) is tuple else (arg,))
+    )
 
 
 def var_default(var: TypeVariable) -> ProcessedArg:
@@ -378,9 +434,19 @@ def var_default(var: TypeVariable) -> ProcessedArg:
 
 class Assignments:
     # Represents the type variable assignments for a particular type.
-    # A cache is used for convenience and to ensure proxies are not created more
+    __slots__ = 'args', 'vars'
+
+    # Caches are used for convenience and to ensure proxies are not created more
     # than once for the same type.
-    cache: Final[dict[TypeOrAlias, Assignments]] = {}
+    # Cache for the types in IMPLICIT_BASES, which live as long as this module
+    # does anyway.
+    _strong_cache: Final[dict[type[object], Assignments]] = {}
+    # Cache for all other types. These are weakly referenced so that Assignments
+    # for short-lived types (e.g., classes created in functions) do not
+    # accumulate in long-running processes.
+    _weak_cache: Final[WeakKeyDictionary[type[object], Assignments]] = (
+        WeakKeyDictionary()
+    )
 
     # Mapping from assigned type variables to their assignments.
     args: TypeAssignments
@@ -446,11 +512,33 @@ class Assignments:
     @staticmethod
     def get(typ: TypeOrAlias) -> Assignments:
         # Get the Assignments object for the given type.
-        if typ in Assignments.cache:
-            return Assignments.cache[typ]
-        return Assignments.cache.setdefault(
-            typ, Assignments.from_type_or_alias(typ)
+        # Note that builtin aliases like list[int] claim to be instances of
+        # type.
+        if not isinstance(typ, type) or isinstance(typ, GenericAlias):
+            return Assignments._get_alias(typ)
+        cache = (
+            Assignments._strong_cache if typ in IMPLICIT_BASES
+            else Assignments._weak_cache
         )
+        if (assignments := cache.get(typ)) is not None:
+            return assignments
+        return cache.setdefault(typ, Assignments.from_type_or_alias(typ))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _get_alias(alias: GeneralAlias) -> Assignments:
+        # Get the Assignments object for the given alias. Aliases like list[int]
+        # are recreated whenever they are written, so they cannot be weakly
+        # referenced in a cache like types are. Instead, the number of cached
+        # aliases is bounded.
+        return Assignments.from_type_or_alias(alias)
+
+    @staticmethod
+    def cache_clear() -> None:
+        # Clear the cached Assignments objects.
+        Assignments._strong_cache.clear()
+        Assignments._weak_cache.clear()
+        Assignments._get_alias.cache_clear()
 
     def __init__(
         self, args: TypeAssignments | None = None, vrs: TypeVariables = ()
@@ -512,20 +600,40 @@ class Assignments:
 
     def update(self, other: Assignments) -> None:
         # Update our assignments with the assignments in other and check their
-        # consistency.
-        self.args = join(other.args, self.args)
-        for var, arg in other.args.items():
-            if self.args[var] != other.args[var]:
+        # consistency. This is equivalent to join(other.args, self.args)
+        # followed by a consistency check, but takes a single pass.
+        other_args = other.args
+        args = dict(other_args)
+        for var, arg in self.args.items():
+            new_arg = args[var] = sub_map(other_args, arg)
+            if var in other_args and new_arg != other_args[var]:
                 raise EnoughTypingErrors.InconsistentInheritance(
-                    var=var.__name__, example1=self.args[var], example2=arg
+                    var=var.__name__, example1=new_arg, example2=other_args[var]
                 )
+        self.args = args
+
+
+def clear_caches() -> None:
+    # Clear all the caches used for inferring type arguments, e.g., to isolate
+    # tests from each other.
+    Assignments.cache_clear()
+    for fn in (
+        _infer_type_args,
+        _process_hashable,
+        get_vars,
+        orig_bases,
+        sub,
+        type_arg_split,
+        unprocess
+    ):
+        fn.cache_clear()
 
 
 def infer_type_args(
     child: TypeOrAlias, parent: GenericType
 ) -> ParameterizedAlias:
     """Return a parameterized alias whose type assignments are inferrable from
-    ``child``.
+    ``child``. Results are cached, so ``child`` and ``parent`` must be hashable.
 
     :param child: Type or alias to infer type arguments from.
     :param parent: Generic type to infer type arguments for.
@@ -541,6 +649,15 @@ def infer_type_args(
           expected number of type arguments to a base, such as, for instance,
           inheriting from ``Sequence[int, str]``.
     """
+    return _infer_type_args(child, parent)
+
+
+@functools.lru_cache(maxsize=2048)
+def _infer_type_args(
+    child: TypeOrAlias, parent: GenericType
+) -> ParameterizedAlias:
+    # Implementation of infer_type_args. Exceptions are not cached, so invalid
+    # arguments raise an error every time.
     origin = typing.get_origin(child) or child
     if not is_generic(parent):
         raise EnoughTypingErrors.NotGeneric(parent=parent)
@@ -108,6 +108,21 @@ def test_enum_errors() -> None:
     assert exc_info.value.type is int
 
 
+def test_enum_errors_class_attributes() -> None:
+    # Test that names in messages only refer to attributes which instances can
+    # see, and that properties of the enumeration class are not evaluated when
+    # the enumerated types are created.
+    class PropertyErrors(EnumErrors[Exception]):
+        Error = 'Error: {prefix}', ()
+
+        @property
+        def prefix(cls) -> str:
+            raise RuntimeError('prefix should not be evaluated')
+
+    with pytest.raises(NameError):
+        str(PropertyErrors.Error())
+
+
 def test_collect_errors() -> None:
     # Test that an exception type can use collect_errors to catch multiple
     # exceptions while mapping values in a collection and raise itself with a
@@ -231,6 +246,32 @@ def test_wrap() -> None:
         pass
 
 
+def test_wrap_fn() -> None:
+    # Test that EnumErrors.wrap_fn wraps exceptions raised by the decorated
+    # function in the same way as EnumErrors.wrap.
+    class TestEnumErrors1(EnumErrors[Exception]):
+        Error1 = 'msg1', ('attr1', 'attr2')
+
+    class TestEnumErrors2(EnumErrors[Exception]):
+        Error2 = 'msg2', ('attr1', 'attr2', 'attr3')
+
+    @TestEnumErrors2.Error2.wrap_fn(
+        TestEnumErrors1.Error1, forward={'attr2'}, attr1=0, attr3=3
+    )
+    def fn(attr1: int, attr2: int) -> int:
+        if attr1 != attr2:
+            raise TestEnumErrors1.Error1(attr1=attr1, attr2=attr2)
+        return attr1
+
+    # No exception should result if nothing is caught.
+    assert fn(1, 1) == 1
+    with enough.raises(TestEnumErrors2.Error2(attr1=0, attr2=2, attr3=3)):
+        fn(1, attr2=2)
+    # Attributes forwarded by one call should not be used by another.
+    with enough.raises(TestEnumErrors2.Error2(attr1=0, attr2=3, attr3=3)):
+        fn(1, 3)
+
+
 def test_wrap_error() -> None:
     # Test that EnumErrors.wrap_error can catch a specified exception type and
     # set it as a destination attribute.
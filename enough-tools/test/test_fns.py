@@ -1,4 +1,6 @@
 import os
+import pathlib
+import sys
 from threading import Thread
 
 import pytest
@@ -22,6 +24,16 @@ def test_bounds() -> None:
     assert enough.bounds(3, [0, 2, 10, 4, 3, 5, 1, -4]) == (3, 3)
 
 
+def test_bounds_query() -> None:
+    # Test that Bounds.query agrees with bounds for every value in and around
+    # a collection, including when the collection is empty.
+    assert enough.Bounds([]).query(3) == (None, None)
+    coll = [0, 2, 10, 4, 3, 5, 5, 1, -4]
+    sorted_bounds = enough.Bounds(coll)
+    for val in range(-6, 13):
+        assert sorted_bounds.query(val) == enough.bounds(val, coll)
+
+
 def test_concat() -> None:
     # Test concat, which should concatenate two sequences into a list.
     assert enough.concat([], []) == []
@@ -47,6 +59,11 @@ def test_dag_stages() -> None:
     # Check that disconnected graphs don't cause an issue.
     assert enough.dag_stages({2: [1], 3: {4}}) == [{1, 4}, {2, 3}]
 
+    # Check that very long dependency chains do not exceed the recursion limit.
+    chain_length = 10 * sys.getrecursionlimit()
+    stages = enough.dag_stages({i: [i + 1] for i in range(chain_length)})
+    assert stages == [{i} for i in range(chain_length, -1, -1)]
+
     # Check that a circular dependency is correctly detected.
     # noinspection PyTypeChecker
     with pytest.raises(EnoughFuncErrors.CircularDependency) as exc_info:
@@ -125,6 +142,29 @@ def test_fqln() -> None:
     assert enough.fqln(Thread) == 'threading.Thread'
 
 
+def test_ls_recursive(tmp_path: pathlib.Path) -> None:
+    # Test that ls_recursive lists every path in a tree, with directories listed
+    # after their contents.
+    (tmp_path / 'dir1' / 'dir2').mkdir(parents=True)
+    (tmp_path / 'file1').touch()
+    (tmp_path / 'dir1' / 'file2').touch()
+    (tmp_path / 'dir1' / 'dir2' / 'file3').touch()
+    paths = list(enough.ls_recursive(str(tmp_path)))
+    assert sorted(paths) == sorted(str(tmp_path / p) for p in (
+        '', 'file1', 'dir1', 'dir1/file2', 'dir1/dir2', 'dir1/dir2/file3'
+    ))
+    for path in paths:
+        if os.path.isdir(path):
+            assert all(
+                paths.index(p) < paths.index(path)
+                for p in paths if p.startswith(path + os.sep)
+            )
+
+    # A file is listed by itself.
+    file1 = str(tmp_path / 'file1')
+    assert list(enough.ls_recursive(file1)) == [file1]
+
+
 def test_raises() -> None:
     # Test that raises can check exception instance equality.
     # Exceptions are not equal even if all their data is equal.
@@ -147,6 +187,138 @@ def test_raises() -> None:
             raise ComparableError(4)
 
 
+def test_replace(tmp_path: pathlib.Path) -> None:
+    # Test that replace moves src to dest, replacing dest if it exists, and
+    # returns whether it existed.
+    src = tmp_path / 'src'
+    dest = tmp_path / 'dest'
+    src.write_text('1')
+    assert not enough.replace(str(src), str(dest))
+    assert not src.exists()
+    assert dest.read_text() == '1'
+
+    # Replace an existing file.
+    src.write_text('2')
+    assert enough.replace(str(src), str(dest))
+    assert dest.read_text() == '2'
+
+    # Replace an existing directory tree.
+    dest.unlink()
+    (dest / 'sub').mkdir(parents=True)
+    (dest / 'sub' / 'file').touch()
+    src.write_text('3')
+    assert enough.replace(str(src), str(dest))
+    assert dest.read_text() == '3'
+
+    # Replace an existing file with a directory tree.
+    src.mkdir()
+    (src / 'file').write_text('4')
+    assert enough.replace(str(src), str(dest))
+    assert not src.exists()
+    assert (dest / 'file').read_text() == '4'
+
+
+def test_rm(tmp_path: pathlib.Path) -> None:
+    # Test that rm removes files and, when recursive=True, directory trees.
+    (tmp_path / 'dir' / 'sub').mkdir(parents=True)
+    (tmp_path / 'dir' / 'sub' / 'file1').touch()
+    (tmp_path / 'file2').touch()
+    assert enough.rm(str(tmp_path / 'file2'))
+    assert not (tmp_path / 'file2').exists()
+    assert enough.rm(str(tmp_path / 'dir'), recursive=True)
+    assert not (tmp_path / 'dir').exists()
+
+    # Missing paths are only an error when force=False.
+    with pytest.raises(FileNotFoundError):
+        enough.rm(str(tmp_path / 'dir'), recursive=True)
+    assert not enough.rm(str(tmp_path / 'dir'), recursive=True, force=True)
+    assert not enough.rm(str(tmp_path / 'file2'), force=True)
+
+    # Symbolic links are removed rather than having their targets checked, even
+    # when they are dangling.
+    (tmp_path / 'dir').mkdir()
+    (tmp_path / 'dir' / 'link').symlink_to(tmp_path / 'missing')
+    assert enough.rm(str(tmp_path / 'dir'), recursive=True)
+    assert not (tmp_path / 'dir').exists()
+
+    # A symbolic link to a directory is removed itself rather than the
+    # directory it points to, with or without force.
+    (tmp_path / 'real').mkdir()
+    (tmp_path / 'real' / 'file').touch()
+    for force in (False, True):
+        (tmp_path / 'link').symlink_to(tmp_path / 'real')
+        assert enough.rm(str(tmp_path / 'link'), recursive=True, force=force)
+        assert not os.path.lexists(tmp_path / 'link')
+        assert (tmp_path / 'real' / 'file').exists()
+
+
+def test_rm_write_protected(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Test that rm with recursive=True removes everything which is not
+    # write-protected and keeps write-protected files and the directories
+    # containing them.
+    (tmp_path / 'dir' / 'sub').mkdir(parents=True)
+    (tmp_path / 'dir' / 'other').mkdir()
+    (tmp_path / 'dir' / 'sub' / 'protected').touch()
+    (tmp_path / 'dir' / 'sub' / 'sibling').touch()
+    (tmp_path / 'dir' / 'other' / 'file').touch()
+    access = os.access
+
+    def fake_access(
+        path: str, mode: int, *, follow_symlinks: bool = True
+    ) -> bool:
+        # Treat files named "protected" as write-protected, following symbolic
+        # links like os.access does when follow_symlinks is True.
+        checked = os.path.realpath(path) if follow_symlinks else path
+        return os.path.basename(checked) != 'protected' and access(
+            path, mode, follow_symlinks=follow_symlinks
+        )
+
+    monkeypatch.setattr(os, 'access', fake_access)
+    with pytest.raises(
+        PermissionError,
+        match='1 write-protected file .*\n.*3 non-protected files'
+    ):
+        enough.rm(str(tmp_path / 'dir'), recursive=True)
+    assert (tmp_path / 'dir' / 'sub' / 'protected').exists()
+    assert not (tmp_path / 'dir' / 'sub' / 'sibling').exists()
+    assert not (tmp_path / 'dir' / 'other').exists()
+
+    # A symbolic link to a write-protected file is not itself write-protected,
+    # whether or not it is removed recursively.
+    for recursive in (False, True):
+        (tmp_path / 'link').symlink_to(tmp_path / 'dir' / 'sub' / 'protected')
+        assert enough.rm(str(tmp_path / 'link'), recursive=recursive)
+        assert not os.path.lexists(tmp_path / 'link')
+    assert (tmp_path / 'dir' / 'sub' / 'protected').exists()
+
+
+def test_swap(tmp_path: pathlib.Path) -> None:
+    # Test that swap exchanges two paths without touching anything else next to
+    # them, such as an entry left behind by an interrupted swap.
+    file1 = tmp_path / 'file1'
+    dir2 = tmp_path / 'dir2'
+    leftover = tmp_path / '.swap-leftover'
+    file1.write_text('1')
+    dir2.mkdir()
+    (dir2 / 'file').write_text('2')
+    leftover.write_text('3')
+    enough.fs.swap(str(file1), str(dir2))
+    assert (file1 / 'file').read_text() == '2'
+    assert dir2.read_text() == '1'
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        '.swap-leftover', 'dir2', 'file1'
+    ]
+    assert leftover.read_text() == '3'
+
+    # A missing path2 leaves path1 in place.
+    with pytest.raises(FileNotFoundError):
+        enough.fs.swap(str(dir2), str(tmp_path / 'missing'))
+    assert dir2.read_text() == '1'
+    assert len(list(tmp_path.iterdir())) == 3
+
+
 def test_temp_file_path() -> None:
     # Test that temp_file_path can be used to create a temporary file and return
     # the string path, deleting the file
@@ -25,21 +25,21 @@ ITERABLE_GROUP = (Iterable, Iterator, Reversible, Collection), (Iterable,), 1
 CONTAINER_GROUP = (Container,), (Container,), 1
 COLLECTION_GROUP = (
     (Collection, Sequence, Set, ValuesView),
-    (Collection,) + ITERABLE_GROUP[1] + CONTAINER_GROUP[1],
+    (Collection, *ITERABLE_GROUP[1], *CONTAINER_GROUP[1]),
     1
 )
-SEQUENCE_GROUP = (Sequence,), (Sequence,) + COLLECTION_GROUP[1], 1
+SEQUENCE_GROUP = (Sequence,), (Sequence, *COLLECTION_GROUP[1]), 1
 MUTABLE_SEQUENCE_GROUP = (
     (MutableSequence, UserList, list, deque),
-    (MutableSequence,) + SEQUENCE_GROUP[1],
+    (MutableSequence, *SEQUENCE_GROUP[1]),
     1
 )
-SET_GROUP = (Set, KeysView, frozenset), (Set,) + COLLECTION_GROUP[1], 1
-MUTABLE_SET_GROUP = (MutableSet, set), (MutableSet,) + SET_GROUP[1], 1
+SET_GROUP = (Set, KeysView, frozenset), (Set, *COLLECTION_GROUP[1]), 1
+MUTABLE_SET_GROUP = (MutableSet, set), (MutableSet, *SET_GROUP[1]), 1
 MAPPING_GROUP = (Mapping,), (Mapping,), 2
 MUTABLE_MAPPING_GROUP = (
     (MutableMapping, ChainMap, OrderedDict, UserDict, defaultdict, dict),
-    (MutableMapping,) + MAPPING_GROUP[1],
+    (MutableMapping, *MAPPING_GROUP[1]),
     2
 )
 ASYNC_ITERABLE_GROUP = (AsyncIterable, AsyncIterator), (AsyncIterable,), 1
@@ -62,8 +62,9 @@ ALL_GROUPS = (
     MUTABLE_SET_GROUP,
     MAPPING_GROUP,
     MUTABLE_MAPPING_GROUP,
-    ASYNC_ITERABLE_GROUP
-) + tuple(((t,), (t,), args) for t, args in ONE_OFFS)
+    ASYNC_ITERABLE_GROUP,
+    *(((t,), (t,), args) for t, args in ONE_OFFS)
+)
 
 random.seed(1234)
 
@@ -72,24 +73,27 @@ TYPE_CHOICES: tuple[type[object], ...] = (
     NoneType, bool, int, float, str, tuple, list, set, frozenset, dict
 )
 
+# Types in TYPE_CHOICES which take a single, optional type parameter.
+SINGLE_PARAM_TYPES: frozenset[type[object]] = frozenset((list, set, frozenset))
+
 
 def gen_type() -> TypeArg:
     nxt = random.choice(TYPE_CHOICES)
-    if nxt in {list, set, frozenset}:
-        if random.choice([False, True]):
+    if nxt in SINGLE_PARAM_TYPES:
+        if random.getrandbits(1):
             # Give a parameter.
             # noinspection PyUnresolvedReferences
             return nxt[gen_type()]
         # Omit a parameter.
         return nxt
     if nxt is dict:
-        if random.choice([False, True]):
+        if random.getrandbits(1):
             # noinspection PyUnresolvedReferences
             return nxt[gen_type(), gen_type()]
     if nxt is tuple:
-        if random.choice([False, True]):
+        if random.getrandbits(1):
             args = []
-            while random.choice([False, True]):
+            while random.getrandbits(1):
                 args.append(gen_type())
             return tuple[tuple(args)]
     return nxt
@@ -156,14 +160,14 @@ def test_infer_type_args() -> None:
             # For each subclass and superclass pair, do num_trials trials
             # wherein the child class's type arguments are tested to see if they
             # match up with the parent class's type arguments.
+            default_args = (Any,) * self.num_vars
             for subclass in self.subclasses:
+                origin = typing.get_origin(subclass) or subclass
                 for superclass in self.superclasses:
-                    assert issubclass(
-                        typing.get_origin(subclass) or subclass, superclass
-                    )
+                    assert issubclass(origin, superclass)
                     assert (
                         enough.infer_type_args(subclass, superclass)
-                        == superclass[(Any,) * self.num_vars]
+                        == superclass[default_args]
                     )
                     for i in range(num_trials):
                         args = tuple(gen_type() for _ in range(self.num_vars))
@@ -1,3 +1,4 @@
+import functools
 import traceback
 
 from enough import EnumErrors
@@ -14,7 +15,7 @@ class CommandError(KeywordCommandsError):
     """Exception class for errors that may be raised in the course of
     :meth:`handling <.CommandHandler.handle>`
     """
-    @property
+    @functools.cached_property
     def exception(self) -> str:
         return ''.join(traceback.format_exception(self.error))
 
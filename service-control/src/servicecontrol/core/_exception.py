@@ -1,3 +1,4 @@
+import functools
 import traceback
 from collections.abc import Callable
 from types import ModuleType
@@ -14,9 +15,10 @@ class ServiceControlError(Exception):
         # Gives the enough module so that it may be used in f-strings.
         return enough
 
-    @property
+    @functools.cached_property
     def _error_tb(self) -> str:
-        # Gives the traceback-formatted exception string.
+        # Gives the traceback-formatted exception string. Formatting walks the
+        # whole traceback, so only do it once per exception.
         return ''.join(traceback.format_exception(self.error))
 
     def _fmt_error_map(